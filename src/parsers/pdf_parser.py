@@ -1,8 +1,16 @@
+import inspect
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Literal, Dict, Any
+from typing import Optional, Literal, Dict, Any, List, Callable
 from pdf_tools import extract_abstract_pymupdf
 from pdf_tools import extract_abstract_unstructured
+from pdf_tools import prefetch_files
 
 @dataclass
 class AbstractExtractionResult:
@@ -12,19 +20,45 @@ class AbstractExtractionResult:
     success: bool
     error: Optional[str] = None
 
+def get_method_kwargs(extract_fn) -> frozenset:
+    """Get the keyword arguments an extraction function accepts besides the PDF path."""
+    return frozenset(list(inspect.signature(extract_fn).parameters)[1:])
+
+# Keyword arguments accepted by each extraction method, derived from their signatures
+PYMUPDF_KWARGS = get_method_kwargs(extract_abstract_pymupdf)
+UNSTRUCTURED_KWARGS = get_method_kwargs(extract_abstract_unstructured)
+
+def check_kwargs(kwargs: Dict[str, Any]) -> None:
+    """Raise ValueError for keyword arguments that no extraction method accepts."""
+    unknown = kwargs.keys() - (PYMUPDF_KWARGS | UNSTRUCTURED_KWARGS)
+    if unknown:
+        raise ValueError(f"Unknown extraction arguments: {', '.join(sorted(unknown))}")
+
+def get_alternative_method(method: str) -> str:
+    """Get the fallback method for an extraction method."""
+    return 'unstructured' if method == 'pymupdf' else 'pymupdf'
+
+def route_kwargs(method: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Select the keyword arguments accepted by an extraction method."""
+    accepted = PYMUPDF_KWARGS if method == 'pymupdf' else UNSTRUCTURED_KWARGS
+    return {k: v for k, v in kwargs.items() if k in accepted}
+
+def run_extraction_method(method: str, pdf_path: Path, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Run a single extraction method, passing it only the keyword arguments it accepts."""
+    if method == 'pymupdf':
+        return extract_abstract_pymupdf(pdf_path, **route_kwargs(method, kwargs))
+    elif method == 'unstructured':
+        return extract_abstract_unstructured(pdf_path, **route_kwargs(method, kwargs))
+    raise ValueError(f"Unknown extraction method: {method}")
+
 class PDFParser:
     """PDF parser for extracting abstracts using different methods."""
     
-    def __init__(self):
-        self.extraction_methods = {
-            'pymupdf': extract_abstract_pymupdf,
-            'unstructured': extract_abstract_unstructured
-        }
-    
     def extract_abstract(self,
                         pdf_path: str | Path,
-                        method: Literal['pymupdf', 'unstructured'] = 'unstructured',
+                        method: Literal['pymupdf', 'unstructured'] = 'pymupdf',
                         fallback: bool = True,
+                        use_cache: bool = True,
                         **kwargs) -> AbstractExtractionResult:
         """
         Extract abstract from PDF using specified method.
@@ -37,14 +71,22 @@ class PDFParser:
             Extraction method to use
         fallback : bool
             Whether to try alternative method if first method fails
+        use_cache : bool
+            Whether to read and write the '.abstract.json' sidecar next to the PDF
         **kwargs
-            Additional arguments passed to extraction methods
+            Additional arguments, each routed to the extraction method that accepts it
             
         Returns:
         --------
         AbstractExtractionResult
             Container with extraction results and metadata
+            
+        Raises:
+        -------
+        ValueError
+            If kwargs contains an argument no extraction method accepts
         """
+        check_kwargs(kwargs)
         if isinstance(pdf_path, str):
             pdf_path = Path(pdf_path)
             
@@ -56,14 +98,30 @@ class PDFParser:
                 error="File not found"
             )
             
+        if use_cache:
+            cached = load_cached_abstract(pdf_path, method, fallback, kwargs)
+            if cached is not None:
+                return cached
+                
+        result = self._extract_abstract(pdf_path, method, fallback, **kwargs)
+        if use_cache and result.success:
+            save_cached_abstract(pdf_path, result, method, kwargs)
+        return result
+    
+    def _extract_abstract(self,
+                          pdf_path: Path,
+                          method: Literal['pymupdf', 'unstructured'],
+                          fallback: bool,
+                          **kwargs) -> AbstractExtractionResult:
+        """Run the extraction methods on an existing PDF, bypassing the cache."""
         try:
-            abstract = self.extraction_methods[method](pdf_path, **kwargs)
+            abstract = run_extraction_method(method, pdf_path, kwargs)
             
             # If primary method fails and fallback is enabled, try alternative
             if abstract is None and fallback:
-                alt_method = 'unstructured' if method == 'pymupdf' else 'pymupdf'
+                alt_method = get_alternative_method(method)
                 try:
-                    abstract = self.extraction_methods[alt_method](pdf_path, **kwargs)
+                    abstract = run_extraction_method(alt_method, pdf_path, kwargs)
                     if abstract is not None:
                         return AbstractExtractionResult(
                             text=abstract,
@@ -88,6 +146,255 @@ class PDFParser:
                 error=str(e)
             )
 
+    def extract_abstracts(self,
+                          pdf_paths: List[str | Path],
+                          method: Literal['pymupdf', 'unstructured'] = 'pymupdf',
+                          fallback: bool = True,
+                          use_cache: bool = True,
+                          num_workers: int = min(os.cpu_count() or 1, 4),
+                          prefetch_depth: int = 32,
+                          **kwargs) -> List[AbstractExtractionResult]:
+        """
+        Extract abstracts from multiple PDFs in parallel.
+        
+        Parameters:
+        -----------
+        pdf_paths : List[str | Path]
+            Paths to the PDF files
+        method : Literal['pymupdf', 'unstructured']
+            Extraction method to use
+        fallback : bool
+            Whether to try alternative method if first method fails
+        use_cache : bool
+            Whether to read and write the '.abstract.json' sidecars next to the PDFs
+        num_workers : int
+            Number of worker processes
+        prefetch_depth : int
+            Maximum number of PDFs submitted to the workers and read ahead at a time
+        **kwargs
+            Additional arguments, each routed to the extraction method that accepts it
+            
+        Returns:
+        --------
+        List[AbstractExtractionResult]
+            Extraction results in the same order as pdf_paths
+            
+        Raises:
+        -------
+        ValueError
+            If kwargs contains an argument no extraction method accepts
+        """
+        check_kwargs(kwargs)
+        extract_one = partial(_extract_one, method=method, fallback=fallback, use_cache=use_cache, **kwargs)
+        results: List[Optional[AbstractExtractionResult]] = [None] * len(pdf_paths)
+        
+        # Resolve cache hits up front so their PDFs are neither read ahead nor sent to workers
+        pending = []
+        for i, pdf_path in enumerate(pdf_paths):
+            cached = load_cached_abstract(Path(pdf_path), method, fallback, kwargs) if use_cache else None
+            if cached is None:
+                pending.append(i)
+            else:
+                results[i] = cached
+                
+        if num_workers <= 1 or len(pending) <= 1:
+            for i in pending:
+                results[i] = extract_one(pdf_paths[i])
+            return results
+            
+        # Not worth the readahead syscalls for a handful of files
+        prefetch = len(pending) > 4
+        window = max(prefetch_depth, num_workers)
+        todo = iter(pending)
+        
+        # Split the cores between workers for OpenMP-based libraries (BLAS, torch). onnxruntime, which
+        # runs the hi_res layout model, sizes its own thread pool and is not capped by this
+        threads_per_worker = max(1, (os.cpu_count() or 1) // num_workers)
+        create_pool = partial(ProcessPoolExecutor,
+                              max_workers=num_workers,
+                              initializer=_init_worker,
+                              initargs=(threads_per_worker,))
+        executor = create_pool()
+        in_flight = {}
+        try:
+            while True:
+                # Files that were in a pool when one of its workers died
+                suspects = []
+                
+                # Top up the window as results come back; queued files are read ahead while workers parse
+                for i in islice(todo, window - len(in_flight)):
+                    if prefetch:
+                        prefetch_files([pdf_paths[i]])
+                    try:
+                        in_flight[executor.submit(extract_one, pdf_paths[i])] = i
+                    except BrokenProcessPool:
+                        suspects.append(i)
+                        break
+                if not in_flight and not suspects:
+                    break
+                    
+                if in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i = in_flight.pop(future)
+                        try:
+                            results[i] = future.result()
+                        except BrokenProcessPool:
+                            suspects.append(i)
+                        except Exception as e:
+                            results[i] = AbstractExtractionResult(
+                                text=None,
+                                method=method,
+                                success=False,
+                                error=str(e)
+                            )
+                            
+                if suspects:
+                    # A worker died (e.g. a MuPDF crash or an OOM kill during hi_res), which fails every
+                    # file still in the pool; keep finished results, retry the rest one by one in
+                    # isolation to pin the failure on the PDF that caused it, then start a fresh pool
+                    for future, i in in_flight.items():
+                        if future.done() and not future.cancelled() and future.exception() is None:
+                            results[i] = future.result()
+                        else:
+                            suspects.append(i)
+                    in_flight.clear()
+                    executor.shutdown(cancel_futures=True)
+                    for i in sorted(suspects):
+                        results[i] = _extract_isolated(extract_one, pdf_paths[i], method, threads_per_worker)
+                    executor = create_pool()
+        finally:
+            executor.shutdown(cancel_futures=True)
+            
+        return results
+
+def get_cache_path(pdf_path: Path) -> Path:
+    """Get the path of the sidecar cache file for a PDF."""
+    return pdf_path.with_suffix('.abstract.json')
+
+def get_cache_kwargs(method: str, result_method: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the routed kwargs of every method that ran to produce a result, as stored in the cache."""
+    cache_kwargs = {method: route_kwargs(method, kwargs)}
+    if result_method != method:
+        cache_kwargs[result_method] = route_kwargs(result_method, kwargs)
+    # Normalize through JSON so freshly passed values compare equal to loaded ones
+    return json.loads(json.dumps(cache_kwargs, default=repr))
+
+def load_cached_abstract(pdf_path: Path,
+                         method: str,
+                         fallback: bool,
+                         kwargs: Dict[str, Any]) -> Optional[AbstractExtractionResult]:
+    """
+    Load a cached abstract if the sidecar matches the PDF and the requested extraction.
+    
+    Parameters:
+    -----------
+    pdf_path : Path
+        Path to the PDF file
+    method : str
+        Requested extraction method
+    fallback : bool
+        Whether a result from the alternative method is acceptable
+    kwargs : Dict[str, Any]
+        Extraction keyword arguments
+        
+    Returns:
+    --------
+    Optional[AbstractExtractionResult]
+        Cached result if the PDF's mtime and size, the requested method and the routed
+        kwargs all match, None otherwise
+    """
+    try:
+        with open(get_cache_path(pdf_path), encoding='utf-8') as f:
+            cache = json.load(f)
+        st = pdf_path.stat()
+    except (OSError, ValueError):
+        return None
+        
+    if not isinstance(cache, dict) or cache.get('mtime') != st.st_mtime or cache.get('size') != st.st_size:
+        return None
+    if cache.get('requested_method') != method:
+        return None
+        
+    result_method = cache.get('method')
+    # A result from the alternative method is only valid when fallback is allowed
+    if result_method != method and not (fallback and result_method == get_alternative_method(method)):
+        return None
+    if cache.get('kwargs') != get_cache_kwargs(method, result_method, kwargs):
+        return None
+        
+    return AbstractExtractionResult(
+        text=cache.get('text'),
+        method=result_method,
+        success=True
+    )
+
+def save_cached_abstract(pdf_path: Path,
+                         result: AbstractExtractionResult,
+                         method: str,
+                         kwargs: Dict[str, Any]) -> None:
+    """Atomically write an extraction result and the extraction it came from to the PDF's sidecar cache file."""
+    cache_path = get_cache_path(pdf_path)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        st = pdf_path.stat()
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'mtime': st.st_mtime,
+                'size': st.st_size,
+                'requested_method': method,
+                'method': result.method,
+                'kwargs': get_cache_kwargs(method, result.method, kwargs),
+                'text': result.text
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort, e.g. the PDF directory may be read-only
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+def _init_worker(num_threads: int) -> None:
+    """Limit OpenMP (BLAS/torch) threads in a worker process; onnxruntime ignores OMP_NUM_THREADS."""
+    os.environ.setdefault('OMP_NUM_THREADS', str(num_threads))
+
+def _extract_isolated(extract_one: Callable[[str | Path], AbstractExtractionResult],
+                      pdf_path: str | Path,
+                      method: str,
+                      num_threads: int) -> AbstractExtractionResult:
+    """Extract abstract from a single PDF in its own worker process, so a crash only fails this PDF."""
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(num_threads,)) as executor:
+        try:
+            return executor.submit(extract_one, pdf_path).result()
+        except BrokenProcessPool:
+            error = "Worker process terminated abruptly during extraction"
+        except Exception as e:
+            error = str(e)
+    return AbstractExtractionResult(
+        text=None,
+        method=method,
+        success=False,
+        error=error
+    )
+
+def _extract_one(pdf_path: str | Path, **kwargs) -> AbstractExtractionResult:
+    """Extract abstract from a single PDF (module-level so it can be pickled)."""
+    return PDFParser().extract_abstract(pdf_path, **kwargs)
+
+def collect_pdf_paths(pattern: str) -> List[Path]:
+    """Expand a file path, directory or glob pattern into a sorted list of PDF paths."""
+    path = Path(pattern)
+    if path.is_dir():
+        candidates = path.iterdir()
+    elif path.exists():
+        return [path]
+    else:
+        anchor = Path(path.anchor) if path.is_absolute() else Path('.')
+        candidates = anchor.glob(str(path.relative_to(anchor)))
+    # Skip the '.abstract.json' sidecars and anything else that is not a PDF
+    return sorted(p for p in candidates if p.suffix.lower() == '.pdf' and p.is_file())
+
 def main():
     """Command-line interface for PDF abstract extraction."""
     import argparse
@@ -101,14 +408,14 @@ def main():
     parser.add_argument(
         'pdf_path',
         type=str,
-        help='Path to the PDF file'
+        help='Path to a PDF file, a directory of PDFs, or a glob pattern'
     )
     
     parser.add_argument(
         '-m', '--method',
         type=str,
         choices=['pymupdf', 'unstructured'],
-        default='unstructured',
+        default='pymupdf',
         help='Method to use for extraction'
     )
     
@@ -125,25 +432,47 @@ def main():
         help='X-axis tolerance for unstructured method'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not write the .abstract.json sidecar cache'
+    )
+    
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        help='Number of worker processes for batch extraction'
+    )
+    
     args = parser.parse_args()
     
-    # Initialize parser and extract abstract
+    pdf_paths = collect_pdf_paths(args.pdf_path)
+    if not pdf_paths:
+        print(f"\nError: No PDF files found for {args.pdf_path}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Initialize parser and extract abstracts
     pdf_parser = PDFParser()
-    result = pdf_parser.extract_abstract(
-        args.pdf_path,
+    results = pdf_parser.extract_abstracts(
+        pdf_paths,
         method=args.method,
         fallback=not args.no_fallback,
+        num_workers=args.workers,
+        use_cache=not args.no_cache,
         x_tolerance=args.x_tolerance
     )
     
     # Handle results
-    if result.success:
-        print(f"\nAbstract extracted using {result.method} method:\n")
-        print(result.text)
-        sys.exit(0)
-    else:
-        print(f"\nError: Failed to extract abstract: {result.error}", file=sys.stderr)
-        sys.exit(1)
+    failed = False
+    for pdf_path, result in zip(pdf_paths, results):
+        if result.success:
+            print(f"\n[{pdf_path}] Abstract extracted using {result.method} method:\n")
+            print(result.text)
+        else:
+            print(f"\n[{pdf_path}] Error: Failed to extract abstract: {result.error}", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
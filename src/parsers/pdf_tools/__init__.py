@@ -1,2 +1,3 @@
 from .pymupdf_tool import extract_abstract_pymupdf
 from .unstructure_tool import extract_abstract_unstructured
+from .prefetch import prefetch_files
@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+from typing import Iterable
+
+# Extraction only reads the first page and the xref/trailer, which sit near the start and end of a PDF
+PREFETCH_HEAD_BYTES = 256 * 1024
+PREFETCH_TAIL_BYTES = 64 * 1024
+
+def prefetch_files(paths: Iterable[str | Path]) -> None:
+    """
+    Ask the kernel to start reading the start and end of files into the page cache in the background.
+    
+    Parameters:
+    -----------
+    paths : Iterable[str | Path]
+        Files that are about to be parsed
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+        
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            # Non-blocking readahead hints, so cold reads overlap with parsing of earlier files
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, 0, min(size, PREFETCH_HEAD_BYTES), os.POSIX_FADV_WILLNEED)
+            if size > PREFETCH_HEAD_BYTES:
+                tail_start = max(PREFETCH_HEAD_BYTES, size - PREFETCH_TAIL_BYTES)
+                os.posix_fadvise(fd, tail_start, size - tail_start, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
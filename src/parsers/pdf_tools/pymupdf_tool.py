@@ -1,20 +1,58 @@
 from typing import List, Optional
 from pathlib import Path
 import fitz  # PyMuPDF
-from .utils import clean_text, is_abstract_header, filter_abnormal_words, DEFAULT_ABNORMAL_PATTERNS
+from .utils import clean_text, is_abstract_header, filter_abnormal_words
 
-def get_block_gap(block1: List, block2: List) -> float:
-    """Calculate vertical gap between two blocks."""
-    return block2[1] - block1[3]  # y0 of block2 - y1 of block1
+# PyMuPDF's default "blocks" flags, making sure image blocks are never extracted
+TEXT_BLOCK_FLAGS = fitz.TEXTFLAGS_BLOCKS & ~fitz.TEXT_PRESERVE_IMAGES
+
+def _init_mupdf() -> None:
+    """Configure the process-wide MuPDF context once, shared by all documents."""
+    # Malformed PDFs are common in batch runs; keep warnings in TOOLS.mupdf_warnings() instead of stderr
+    fitz.TOOLS.mupdf_display_warnings(False)
+
+_init_mupdf()
+
+def find_gap_cutoff(y0, y1, initial_gaps: int, gap_threshold: float) -> int:
+    """
+    Find how many consecutive blocks belong to the abstract based on gap consistency.
+    
+    Parameters:
+    -----------
+    y0, y1 : sequence of float
+        Top and bottom y-coordinates of the candidate blocks
+    initial_gaps : int
+        Number of leading gaps accepted without checking consistency
+    gap_threshold : float
+        Maximum relative deviation of a gap from the running average gap
+        
+    Returns:
+    --------
+    int
+        Number of leading blocks to keep
+    """
+    gap_sum = 0.0
+    gap_n = 0
+    for i in range(len(y0) - 1):
+        gap = y0[i + 1] - y1[i]  # y0 of next block - y1 of current block
+        if gap_n >= initial_gaps and gap_n > 0:
+            avg_gap = gap_sum / gap_n
+            # Break if gap deviates significantly from average
+            if abs(gap - avg_gap) > gap_threshold * avg_gap:
+                return i + 1
+        gap_sum += gap
+        gap_n += 1
+    return len(y0)
 
 def find_abstract_block_idx(blocks: List) -> Optional[int]:
     """Find the index of the block containing the abstract header."""
     for i, block in enumerate(blocks):
-        if is_abstract_header(block[4]):
+        # Only the start of a block can hold the header; also keeps the cache keys short
+        if is_abstract_header(block[4].lstrip()[:32]):
             return i
     return None
 
-def extract_abstract_pymupdf(pdf_path: Path,
+def extract_abstract_pymupdf(pdf_path: Path | fitz.Document,
                            min_words: int = 100,
                            initial_blocks: int = 5,
                            gap_threshold: float = 0.5) -> Optional[str]:
@@ -23,8 +61,8 @@ def extract_abstract_pymupdf(pdf_path: Path,
     
     Parameters:
     -----------
-    pdf_path : Path
-        Path to the PDF file
+    pdf_path : Path | fitz.Document
+        Path to the PDF file, or an already opened document which is left open
     min_words : int
         Minimum number of words expected in abstract
     initial_blocks : int
@@ -38,51 +76,34 @@ def extract_abstract_pymupdf(pdf_path: Path,
     Optional[str]
         Extracted abstract text if found, None otherwise
     """
-    doc = fitz.open(pdf_path)
-    page = doc[0]
-    blocks = page.get_text("blocks")
+    owns_doc = not isinstance(pdf_path, fitz.Document)
+    doc = fitz.open(pdf_path) if owns_doc else pdf_path
+    try:
+        # Build the text page once and extract its blocks from it
+        textpage = doc[0].get_textpage(flags=TEXT_BLOCK_FLAGS)
+        blocks = textpage.extractBLOCKS()
+    finally:
+        if owns_doc:
+            doc.close()
     
     abstract_idx = find_abstract_block_idx(blocks)
-    if abstract_idx is None:
-        doc.close()
+    if abstract_idx is None or abstract_idx + 1 >= len(blocks):
         return None
-        
-    next_block = blocks[abstract_idx + 1]
-    next_block_text = next_block[4]
+    
+    # Only blocks after the header can belong to the abstract
+    candidates = blocks[abstract_idx + 1:]
+    next_block_text = candidates[0][4]
     
     # Case 1: Next block is complete abstract
-    if len(next_block_text.split()) > min_words:
-        doc.close()
-        return filter_abnormal_words(next_block_text, DEFAULT_ABNORMAL_PATTERNS)
+    # A block of n characters holds at most (n + 1) // 2 words, so only blocks long
+    # enough to qualify pay for the exact split-based word count
+    if ((len(next_block_text) + 1) // 2 > min_words and
+            len(next_block_text.split()) > min_words):
+        return filter_abnormal_words(next_block_text)
     
     # Case 2: Abstract is split into multiple blocks
-    collected_blocks = [blocks[abstract_idx + 1]]
-    gaps = []
-    current_idx = abstract_idx + 1
-    
-    while current_idx < len(blocks) - 1 and len(collected_blocks) < initial_blocks:
-        current_block = blocks[current_idx]
-        next_block = blocks[current_idx + 1]
-        gap = get_block_gap(current_block, next_block)
-        gaps.append(gap)
-        collected_blocks.append(next_block)
-        current_idx += 1
-
-    while current_idx < len(blocks) - 1:
-        current_block = blocks[current_idx]
-        next_block = blocks[current_idx + 1]
-        gap = get_block_gap(current_block, next_block)
-        
-        # Calculate average gap from previous blocks
-        avg_gap = sum(gaps) / len(gaps)
-        
-        # Break if gap deviates significantly from average
-        if abs(gap - avg_gap) > gap_threshold * avg_gap:  # 50% threshold
-            break
-                
-        gaps.append(gap)
-        collected_blocks.append(next_block)
-        current_idx += 1
+    y0 = [block[1] for block in candidates]
+    y1 = [block[3] for block in candidates]
+    cutoff = find_gap_cutoff(y0, y1, initial_blocks - 1, gap_threshold)
     
-    doc.close()
-    return clean_text(' '.join(block[4] for block in collected_blocks))
+    return clean_text(' '.join(block[4] for block in candidates[:cutoff]))
@@ -1,27 +1,53 @@
 import io
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
-from pypdf import PdfReader, PdfWriter
-from unstructured.partition.pdf import partition_pdf
+import fitz  # PyMuPDF
 from .utils import clean_text, is_abstract_header
 
-def parse_pdf_unstructured(file_path: Path):
-    """Parse PDF using unstructured library."""
-    reader = PdfReader(str(file_path))
-    page = reader.pages[0]
+# Resolution the hi_res strategy renders pages at; x_tolerance is given in pixels at this resolution
+HI_RES_DPI = 200
+
+def parse_pdf_unstructured(file_path: Path,
+                           strategies: Tuple[str, ...] = ("fast", "hi_res")) -> Iterator[Tuple[List, float]]:
+    """
+    Parse the first page of a PDF using unstructured library.
     
-    writer = PdfWriter()
-    writer.add_page(page)
+    Parameters:
+    -----------
+    file_path : Path
+        Path to the PDF file
+    strategies : Tuple[str, ...]
+        Partitioning strategies to try, cheapest first
+        
+    Yields:
+    -------
+    Tuple[List, float]
+        Elements partitioned with each strategy in turn, and the page width in PDF points;
+        later strategies only run if iterated
+    """
+    # Imported lazily: unstructured pulls in onnxruntime and the layout models,
+    # which would otherwise slow down startup of the PyMuPDF-only path
+    from unstructured.partition.pdf import partition_pdf
     
-    buffer = io.BytesIO()
-    writer.write(buffer)
-    buffer.seek(0)
+    # Split off the first page with MuPDF instead of a pure-Python reader/writer round-trip
+    doc = fitz.open(file_path)
+    try:
+        doc.select([0])
+        page_width = doc[0].rect.width
+        # Drop objects only referenced by the removed pages so unstructured gets a one-page file
+        buffer = io.BytesIO(doc.tobytes(garbage=1))
+    finally:
+        doc.close()
     
-    return partition_pdf(
-        file=buffer,
-        include_metadata=True,
-        strategy="hi_res"
-    )
+    for strategy in strategies:
+        buffer.seek(0)
+        elements = partition_pdf(
+            file=buffer,
+            include_metadata=True,
+            strategy=strategy,
+            **({"hi_res_model_name": "yolox", "pdf_image_dpi": HI_RES_DPI} if strategy == "hi_res" else {})
+        )
+        yield elements, page_width
 
 def extract_abstract_unstructured(pdf_path: Path,
                                 x_tolerance: int = 20) -> Optional[str]:
@@ -33,19 +59,31 @@ def extract_abstract_unstructured(pdf_path: Path,
     pdf_path : Path
         Path to the PDF file
     x_tolerance : int
-        Horizontal alignment tolerance in pixels
+        Horizontal alignment tolerance in pixels at the hi_res resolution (HI_RES_DPI);
+        converted to each strategy's coordinate units, e.g. PDF points for "fast"
         
     Returns:
     --------
     Optional[str]
         Extracted abstract text if found, None otherwise
     """
-    elements = parse_pdf_unstructured(pdf_path)
+    # Try the rule-based strategy first and only run the layout model if it yields no abstract
+    for elements, page_width in parse_pdf_unstructured(pdf_path):
+        abstract = find_abstract_in_elements(elements, x_tolerance, page_width)
+        if abstract is not None:
+            return abstract
+    return None
+
+def find_abstract_in_elements(elements: List, x_tolerance: float, page_width: float) -> Optional[str]:
+    """Find the abstract body block aligned below the abstract header among partitioned elements."""
+    # Imported lazily so that a PyMuPDF-only install can import pdf_tools without numpy
+    import numpy as np
     
     # Find abstract header
     abstract_header = None
     for element in elements:
-        if is_abstract_header(str(element)):
+        # Only the start of an element can hold the header; also keeps the cache keys short
+        if is_abstract_header(str(element).lstrip()[:32]):
             abstract_header = element
             break
             
@@ -56,36 +94,39 @@ def extract_abstract_unstructured(pdf_path: Path,
     if not header_coords:
         return None
         
+    # "fast" coordinates are PDF points, hi_res ones are pixels; rescale the hi_res pixel tolerance
+    system_width = getattr(getattr(header_coords, 'system', None), 'width', None)
+    if system_width and page_width:
+        x_tolerance = x_tolerance * (72 / HI_RES_DPI) * (system_width / page_width)
+        
     # Get header coordinates
     header_left_x = header_coords.points[0][0]
     header_right_x = header_coords.points[3][0]
     header_bottom_y = header_coords.points[1][1]
+    header_height = header_coords.points[1][1] - header_coords.points[0][1]
     
-    # Find closest aligned block
-    closest_distance = float('inf')
-    closest_block = None
-    
-    for element in elements:
-        if not (hasattr(element, 'metadata') and element.metadata.coordinates):
+    # Gather block coordinates into flat arrays
+    n = len(elements)
+    left_x = np.zeros(n)
+    right_x = np.zeros(n)
+    top_y = np.full(n, -np.inf)  # Elements without coordinates never pass the alignment check
+    bottom_y = np.zeros(n)
+    for i, element in enumerate(elements):
+        block_coords = getattr(getattr(element, 'metadata', None), 'coordinates', None)
+        points = getattr(block_coords, 'points', None)
+        if not points:
             continue
-            
-        block_coords = element.metadata.coordinates
-        block_left_x = block_coords.points[0][0]
-        block_right_x = block_coords.points[3][0]
-        block_top_y = block_coords.points[0][1]
+        left_x[i], right_x[i] = points[0][0], points[3][0]
+        top_y[i], bottom_y[i] = points[0][1], points[1][1]
+    
+    # Find closest aligned block that is considerably taller than the header
+    aligned = ((top_y >= header_bottom_y) &
+               (left_x <= header_left_x + x_tolerance) &
+               (right_x >= header_right_x - x_tolerance) &
+               (bottom_y - top_y > 2 * header_height))
+    if not aligned.any():
+        return None
         
-        # Check alignment
-        if (block_top_y < header_bottom_y or
-            block_left_x > header_left_x + x_tolerance or
-            block_right_x < header_right_x - x_tolerance):
-            continue
-            
-        distance = block_top_y - header_bottom_y
-        if distance < closest_distance:
-            block_height = block_coords.points[1][1] - block_coords.points[0][1]
-            header_height = header_coords.points[1][1] - header_coords.points[0][1]
-            if block_height > 2 * header_height:
-                closest_distance = distance
-                closest_block = element
-                
-    return clean_text(str(closest_block)) if closest_block else None
\ No newline at end of file
+    distances = np.where(aligned, top_y - header_bottom_y, np.inf)
+    closest_block = elements[int(np.argmin(distances))]
+    return clean_text(str(closest_block))